@@ -107,6 +107,31 @@ describe('buildPaneSvgDocument', () => {
     expect(result.height).toBe(220);
     expect(result.svgText).toContain('height="220"');
   });
+
+  it('embeds the document stylesheet text in every export of a batch', () => {
+    const style = document.createElement('style');
+    style.textContent = '.batch-pane { color: red; }';
+    document.head.appendChild(style);
+
+    const first = document.createElement('div');
+    first.innerHTML = '<div class="batch-pane">one</div>';
+    const second = document.createElement('div');
+    second.innerHTML = '<div class="batch-pane">two</div>';
+
+    const results = collectShowcaseSvgExports(
+      document,
+      new Map([
+        ['first', first],
+        ['second', second],
+      ]),
+    );
+    style.remove();
+
+    expect(results).toHaveLength(2);
+    results.forEach((result) => {
+      expect(result.svgText).toContain('.batch-pane');
+    });
+  });
 });
 
 describe('toExportFileName', () => {
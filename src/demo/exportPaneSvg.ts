@@ -167,12 +167,17 @@ export function buildPaneSvgDocument(
   ].join('\n');
 }
 
-function buildShowcaseSvgExport(doc: Document, key: string, target: HTMLElement): ShowcaseSvgExport {
+function buildShowcaseSvgExport(
+  doc: Document,
+  key: string,
+  target: HTMLElement,
+  cssText: string,
+): ShowcaseSvgExport {
   const { width, height } = measureTarget(target);
   const svgText = buildPaneSvgDocument(doc, target, {
     width,
     height,
-    cssText: serializeAccessibleCss(doc),
+    cssText,
   });
 
   return {
@@ -188,8 +193,11 @@ export function collectShowcaseSvgExports(
   doc: Document,
   exportTargets: Map<string, HTMLElement>,
 ) {
+  // Every target shares the same document stylesheets, so walk the CSSOM once
+  // per batch instead of once per exported image.
+  const cssText = serializeAccessibleCss(doc);
   return Array.from(exportTargets.entries()).map(([key, target]) =>
-    buildShowcaseSvgExport(doc, key, target),
+    buildShowcaseSvgExport(doc, key, target, cssText),
   );
 }
 
@@ -214,7 +222,7 @@ export function installShowcaseExportApi(args: {
         throw new Error(`Unknown showcase export target: ${key}`);
       }
 
-      const result = buildShowcaseSvgExport(doc, key, target);
+      const result = buildShowcaseSvgExport(doc, key, target, serializeAccessibleCss(doc));
       if (options?.download !== false) {
         triggerSvgDownload(doc, result.fileName, result.svgText);
       }